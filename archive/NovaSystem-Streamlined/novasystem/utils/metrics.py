@@ -5,20 +5,37 @@ This module provides comprehensive performance monitoring, metrics collection,
 and analytics for the NovaSystem framework.
 """
 
+import os
 import time
 import psutil
 import logging
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
+from collections import Counter, OrderedDict, defaultdict, deque
 import json
 import threading
 from functools import wraps
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional accelerator; plain-float sums are the fallback
+    np = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _tail(d: deque, n: int) -> List[Any]:
+    """Last n elements of a deque without materializing the whole thing."""
+    return list(islice(d, max(0, len(d) - n), len(d)))
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Container for performance metrics."""
 
@@ -48,6 +65,28 @@ class PerformanceMetrics:
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
 
+    # Monotonic clock reading taken at session start; durations are computed
+    # from this so wall-clock adjustments (NTP) can't skew timings
+    start_monotonic: float = field(default_factory=time.monotonic, repr=False, compare=False)
+
+    # Cached JSON rendering, invalidated whenever a field mutates
+    _json_cache: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name != '_json_cache':
+            object.__setattr__(self, '_json_cache', None)
+        object.__setattr__(self, name, value)
+
+    def to_json(self) -> str:
+        """Serialize to JSON, reusing the cached rendering when unchanged."""
+        if self._json_cache is None:
+            if orjson is not None:
+                rendered = orjson.dumps(self.to_dict()).decode()
+            else:
+                rendered = json.dumps(self.to_dict())
+            object.__setattr__(self, '_json_cache', rendered)
+        return self._json_cache
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary."""
         return {
@@ -75,27 +114,124 @@ class PerformanceMetrics:
             },
             'timestamps': {
                 'start_time': self.start_time.isoformat(),
-                'end_time': self.end_time.isoformat() if self.end_time else None,
+                'end_time': self._end_time_isoformat(),
             }
         }
 
+    def _end_time_isoformat(self) -> Optional[str]:
+        """Human-readable end time, derived lazily from the monotonic duration."""
+        if self.end_time is not None:
+            return self.end_time.isoformat()
+        if self.total_time:
+            return (self.start_time + timedelta(seconds=self.total_time)).isoformat()
+        return None
+
+@dataclass
+class SessionSummary:
+    """Finalized, precomputed summary for a session.
+
+    Built once in end_session() so consumers never have to reduce the raw
+    per-event metrics again.
+    """
+
+    session_id: str
+    total_sessions: int = 0
+    total_time: float = 0.0
+    average_llm_response_time: float = 0.0
+    total_tokens_generated: int = 0
+    total_iterations: int = 0
+    models_used: List[str] = field(default_factory=list)
+    last_session: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert summary to dictionary."""
+        return {
+            'session_id': self.session_id,
+            'total_sessions': self.total_sessions,
+            'total_time': self.total_time,
+            'average_llm_response_time': self.average_llm_response_time,
+            'total_tokens_generated': self.total_tokens_generated,
+            'total_iterations': self.total_iterations,
+            'models_used': self.models_used,
+            'last_session': self.last_session,
+        }
+
+
+class _NullMetrics:
+    """Stand-in for "no active session": attribute mutations are silently
+    discarded, so the record_* hot paths need no per-call None check.
+
+    Falsy on purpose -- ``if self.current_metrics`` still distinguishes an
+    active session from the null object.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+    def __getattr__(self, name):
+        return 0
+
+
+_NULL_METRICS = _NullMetrics()
+
+
 class MetricsCollector:
     """Collects and manages performance metrics."""
 
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, max_sessions: int = 256,
+                 max_session_entries: int = 64):
         """
         Initialize metrics collector.
 
         Args:
             max_history: Maximum number of historical metrics to keep
+            max_sessions: Maximum number of distinct session ids to retain
+            max_session_entries: Maximum metrics entries kept per session
         """
         self.max_history = max_history
-        self.current_metrics: Optional[PerformanceMetrics] = None
+        self.max_sessions = max_sessions
+        self.max_session_entries = max_session_entries
+        self.current_metrics: PerformanceMetrics = _NULL_METRICS
         self.historical_metrics: deque = deque(maxlen=max_history)
-        self.session_metrics: Dict[str, List[PerformanceMetrics]] = defaultdict(list)
+        # LRU-ordered: oldest session ids are evicted once max_sessions is
+        # exceeded, so long-running servers don't leak per-session state.
+        self.session_metrics: "OrderedDict[str, deque]" = OrderedDict()
+        self._session_last_seen: Dict[str, float] = {}
         self.lock = threading.Lock()
+        # Separate lock for the system-metrics deques so readers never wait
+        # behind the session lock (or the blocking psutil sampling).
+        self._sys_lock = threading.Lock()
+
+        # Running aggregates over the recent-session window, updated once per
+        # end_session() so summary queries are O(1) instead of re-scanning
+        # the history on every call. With NumPy available the numeric fields
+        # live in parallel ring buffers (SoA) so averages reduce in one C
+        # loop; without it, running window sums keep the means O(1).
+        self.recent_window: deque = deque(maxlen=100)
+        if np is not None:
+            self._hist = {
+                k: np.zeros(self.recent_window.maxlen, dtype=np.float64)
+                for k in ('total_time', 'llm_time', 'peak_mem')
+            }
+        else:
+            self._hist = None
+            self._win_sums = {k: 0.0 for k in ('total_time', 'llm_time', 'peak_mem')}
+        self._hist_head = 0
+        self._hist_len = 0
+        self._model_counter: Counter = Counter()
+        # Welford accumulators (count, mean, M2) per metric, covering every
+        # session ever recorded: O(1) update per session, O(1) mean/stddev.
+        self._welford = {k: [0, 0.0, 0.0] for k in ('total_time', 'llm_time', 'peak_mem')}
+        self._session_agg: Dict[str, Dict[str, Any]] = {}
+        self.session_summaries: Dict[str, deque] = defaultdict(lambda: deque(maxlen=64))
 
         # System monitoring
+        self._last_sys_ts_iso: Optional[str] = None
         self.system_metrics = {
             'cpu_percent': deque(maxlen=100),
             'memory_percent': deque(maxlen=100),
@@ -117,49 +253,149 @@ class MetricsCollector:
         """End monitoring for a session."""
         with self.lock:
             if self.current_metrics:
-                self.current_metrics.end_time = datetime.now()
                 self.current_metrics.total_time = (
-                    self.current_metrics.end_time - self.current_metrics.start_time
-                ).total_seconds()
+                    time.monotonic() - self.current_metrics.start_monotonic
+                )
 
                 # Store in history
                 self.historical_metrics.append(self.current_metrics)
-                self.session_metrics[session_id].append(self.current_metrics)
+                self._store_session_metrics(session_id, self.current_metrics)
+                self._update_aggregates(session_id, self.current_metrics)
 
-                logger.info(f"Ended metrics collection for session {session_id}")
-                logger.info(f"Total time: {self.current_metrics.total_time:.2f}s")
+                logger.info("Ended metrics collection for session %s", session_id)
+                logger.info("Total time: %.2fs", self.current_metrics.total_time)
 
                 completed_metrics = self.current_metrics
-                self.current_metrics = None
+                self.current_metrics = _NULL_METRICS
                 return completed_metrics
             return None
 
+    def _store_session_metrics(self, session_id: str, metrics: PerformanceMetrics):
+        """Store a session entry, evicting the least-recently-used session
+        once max_sessions is exceeded."""
+        entries = self.session_metrics.get(session_id)
+        if entries is None:
+            entries = self.session_metrics[session_id] = deque(maxlen=self.max_session_entries)
+        else:
+            self.session_metrics.move_to_end(session_id)
+        entries.append(metrics)
+        self._session_last_seen[session_id] = time.monotonic()
+
+        while len(self.session_metrics) > self.max_sessions:
+            evicted_id, _ = self.session_metrics.popitem(last=False)
+            self._drop_session_state(evicted_id)
+
+    def _drop_session_state(self, session_id: str):
+        """Forget all derived state for a session id."""
+        self._session_last_seen.pop(session_id, None)
+        self._session_agg.pop(session_id, None)
+        self.session_summaries.pop(session_id, None)
+
+    def prune_sessions(self, max_age_seconds: float):
+        """Drop sessions that have not recorded metrics within max_age_seconds."""
+        with self.lock:
+            cutoff = time.monotonic() - max_age_seconds
+            stale = [sid for sid, seen in self._session_last_seen.items() if seen < cutoff]
+            for sid in stale:
+                self.session_metrics.pop(sid, None)
+                self._drop_session_state(sid)
+
+    def _update_aggregates(self, session_id: str, metrics: PerformanceMetrics):
+        """Fold a finished session into the running aggregates.
+
+        Called once per end_session() while holding the lock, so the
+        summary endpoints never have to re-scan the history.
+        """
+        # Sliding window: evict the oldest entry's contribution before
+        # appending, since deque(maxlen=...) would drop it silently.
+        if len(self.recent_window) == self.recent_window.maxlen:
+            evicted = self.recent_window.popleft()
+            self._model_counter[evicted.model_used] -= 1
+            if self._model_counter[evicted.model_used] <= 0:
+                del self._model_counter[evicted.model_used]
+            if self._hist is None:
+                self._win_sums['total_time'] -= evicted.total_time
+                self._win_sums['llm_time'] -= evicted.llm_response_time
+                self._win_sums['peak_mem'] -= evicted.peak_memory_mb
+
+        self.recent_window.append(metrics)
+        self._model_counter[metrics.model_used] += 1
+
+        if self._hist is not None:
+            # Overwrite the ring slot at the head; the slot being replaced is
+            # the same entry the deque just evicted.
+            self._hist['total_time'][self._hist_head] = metrics.total_time
+            self._hist['llm_time'][self._hist_head] = metrics.llm_response_time
+            self._hist['peak_mem'][self._hist_head] = metrics.peak_memory_mb
+            self._hist_head = (self._hist_head + 1) % self.recent_window.maxlen
+        else:
+            self._win_sums['total_time'] += metrics.total_time
+            self._win_sums['llm_time'] += metrics.llm_response_time
+            self._win_sums['peak_mem'] += metrics.peak_memory_mb
+        self._hist_len = min(self._hist_len + 1, self.recent_window.maxlen)
+
+        # Welford recurrence for the lifetime mean/variance of each metric
+        for key, value in (('total_time', metrics.total_time),
+                           ('llm_time', metrics.llm_response_time),
+                           ('peak_mem', metrics.peak_memory_mb)):
+            state = self._welford[key]
+            state[0] += 1
+            delta = value - state[1]
+            state[1] += delta / state[0]
+            state[2] += delta * (value - state[1])
+
+        # Per-session rollup
+        session_agg = self._session_agg.setdefault(session_id, {
+            'count': 0,
+            'total_time': 0.0,
+            'sum_llm_time': 0.0,
+            'total_tokens': 0,
+            'total_iterations': 0,
+            'models_used': set(),
+        })
+        session_agg['count'] += 1
+        session_agg['total_time'] += metrics.total_time
+        session_agg['sum_llm_time'] += metrics.llm_response_time
+        session_agg['total_tokens'] += metrics.tokens_generated
+        session_agg['total_iterations'] += metrics.iterations_completed
+        session_agg['models_used'].add(metrics.model_used)
+
+        # Emit the finalized summary once; readers just pick up the latest.
+        self.session_summaries[session_id].append(SessionSummary(
+            session_id=session_id,
+            total_sessions=session_agg['count'],
+            total_time=session_agg['total_time'],
+            average_llm_response_time=session_agg['sum_llm_time'] / session_agg['count'],
+            total_tokens_generated=session_agg['total_tokens'],
+            total_iterations=session_agg['total_iterations'],
+            models_used=list(session_agg['models_used']),
+            last_session=metrics.to_dict(),
+        ))
+
     def record_llm_call(self, model: str, response_time: float,
                        tokens_input: int = 0, tokens_generated: int = 0):
         """Record an LLM call."""
-        if self.current_metrics:
-            self.current_metrics.model_used = model
-            self.current_metrics.llm_response_time += response_time
-            self.current_metrics.tokens_input += tokens_input
-            self.current_metrics.tokens_generated += tokens_generated
+        self.current_metrics.model_used = model
+        self.current_metrics.llm_response_time += response_time
+        self.current_metrics.tokens_input += tokens_input
+        self.current_metrics.tokens_generated += tokens_generated
 
     def record_iteration(self):
         """Record a completed iteration."""
-        if self.current_metrics:
-            self.current_metrics.iterations_completed += 1
+        self.current_metrics.iterations_completed += 1
 
     def record_agent_usage(self, agent_count: int = 1):
         """Record agent usage."""
-        if self.current_metrics:
-            self.current_metrics.agents_used += agent_count
+        self.current_metrics.agents_used += agent_count
 
     def record_error(self):
         """Record an error."""
-        if self.current_metrics:
-            self.current_metrics.errors_encountered += 1
+        self.current_metrics.errors_encountered += 1
 
     def record_memory_usage(self):
         """Record current memory usage."""
+        # Guard kept here: the psutil read itself is the expensive part and
+        # should be skipped entirely when no session is active.
         if self.current_metrics:
             process = psutil.Process()
             memory_info = process.memory_info()
@@ -174,7 +410,8 @@ class MetricsCollector:
         def monitor():
             while True:
                 try:
-                    # CPU and memory
+                    # Sample outside any lock -- cpu_percent blocks for its
+                    # full interval and must not stall readers.
                     cpu_percent = psutil.cpu_percent(interval=1)
                     memory_percent = psutil.virtual_memory().percent
 
@@ -182,10 +419,13 @@ class MetricsCollector:
                     disk_io = psutil.disk_io_counters()
                     disk_io_mb = (disk_io.read_bytes + disk_io.write_bytes) / 1024 / 1024 if disk_io else 0
 
-                    with self.lock:
+                    with self._sys_lock:
                         self.system_metrics['cpu_percent'].append(cpu_percent)
                         self.system_metrics['memory_percent'].append(memory_percent)
                         self.system_metrics['disk_io'].append(disk_io_mb)
+                        # Formatted once per sample so readers don't pay for
+                        # datetime construction on every poll
+                        self._last_sys_ts_iso = datetime.now().isoformat(timespec='seconds')
 
                     time.sleep(5)  # Monitor every 5 seconds
                 except Exception as e:
@@ -196,63 +436,52 @@ class MetricsCollector:
         monitor_thread.start()
 
     def get_session_summary(self, session_id: str) -> Dict[str, Any]:
-        """Get summary metrics for a session."""
-        if session_id not in self.session_metrics:
+        """Get the finalized summary for a session as a dict ({} if unknown)."""
+        summaries = self.session_summaries.get(session_id)
+        if not summaries:
             return {}
-
-        metrics_list = self.session_metrics[session_id]
-        if not metrics_list:
-            return {}
-
-        # Calculate averages and totals
-        total_time = sum(m.total_time for m in metrics_list)
-        avg_llm_time = sum(m.llm_response_time for m in metrics_list) / len(metrics_list)
-        total_tokens = sum(m.tokens_generated for m in metrics_list)
-        total_iterations = sum(m.iterations_completed for m in metrics_list)
-
-        return {
-            'session_id': session_id,
-            'total_sessions': len(metrics_list),
-            'total_time': total_time,
-            'average_llm_response_time': avg_llm_time,
-            'total_tokens_generated': total_tokens,
-            'total_iterations': total_iterations,
-            'models_used': list(set(m.model_used for m in metrics_list)),
-            'last_session': metrics_list[-1].to_dict() if metrics_list else None
-        }
+        return summaries[-1].to_dict()
 
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get current system metrics."""
-        with self.lock:
+        with self._sys_lock:
             return {
-                'cpu_percent': list(self.system_metrics['cpu_percent'])[-10:],  # Last 10 readings
-                'memory_percent': list(self.system_metrics['memory_percent'])[-10:],
-                'disk_io_mb': list(self.system_metrics['disk_io'])[-10:],
-                'timestamp': datetime.now().isoformat()
+                'cpu_percent': _tail(self.system_metrics['cpu_percent'], 10),  # Last 10 readings
+                'memory_percent': _tail(self.system_metrics['memory_percent'], 10),
+                'disk_io_mb': _tail(self.system_metrics['disk_io'], 10),
+                'timestamp': self._last_sys_ts_iso or datetime.now().isoformat(timespec='seconds')
             }
 
+    def _welford_stddev(self, key: str) -> float:
+        """Population standard deviation from the Welford accumulator."""
+        count, _, m2 = self._welford[key]
+        return (m2 / count) ** 0.5 if count else 0.0
+
+    def _window_mean(self, key: str) -> float:
+        """Mean over the recent-session window (NumPy ring or plain sums)."""
+        count = self._hist_len
+        if not count:
+            return 0.0
+        if self._hist is not None:
+            return float(self._hist[key][:count].mean())
+        return self._win_sums[key] / count
+
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get overall performance summary."""
-        if not self.historical_metrics:
+        count = self._hist_len
+        if not count:
             return {'message': 'No metrics available yet'}
 
-        recent_metrics = list(self.historical_metrics)[-100:]  # Last 100 sessions
-
-        avg_total_time = sum(m.total_time for m in recent_metrics) / len(recent_metrics)
-        avg_llm_time = sum(m.llm_response_time for m in recent_metrics) / len(recent_metrics)
-        avg_memory = sum(m.peak_memory_mb for m in recent_metrics) / len(recent_metrics)
-
-        model_usage = defaultdict(int)
-        for m in recent_metrics:
-            model_usage[m.model_used] += 1
-
         return {
             'total_sessions': len(self.historical_metrics),
-            'recent_sessions': len(recent_metrics),
-            'average_total_time': avg_total_time,
-            'average_llm_response_time': avg_llm_time,
-            'average_peak_memory_mb': avg_memory,
-            'model_usage': dict(model_usage),
+            'recent_sessions': count,
+            'average_total_time': self._window_mean('total_time'),
+            'average_llm_response_time': self._window_mean('llm_time'),
+            'average_peak_memory_mb': self._window_mean('peak_mem'),
+            'stddev_total_time': self._welford_stddev('total_time'),
+            'stddev_llm_response_time': self._welford_stddev('llm_time'),
+            'stddev_peak_memory_mb': self._welford_stddev('peak_mem'),
+            'model_usage': dict(self._model_counter),
             'system_metrics': self.get_system_metrics()
         }
 
@@ -263,41 +492,63 @@ def get_metrics_collector() -> MetricsCollector:
     """Get the global metrics collector instance."""
     return _metrics_collector
 
-def monitor_performance(func: Callable) -> Callable:
-    """Decorator to monitor function performance."""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss / 1024 / 1024
-
-        try:
-            result = func(*args, **kwargs)
-            return result
-        finally:
-            end_time = time.time()
-            end_memory = psutil.Process().memory_info().rss / 1024 / 1024
-
-            execution_time = end_time - start_time
-            memory_used = end_memory - start_memory
-
-            logger.info(f"Function {func.__name__} executed in {execution_time:.2f}s, "
-                       f"memory change: {memory_used:+.2f}MB")
-
-    return wrapper
+def monitor_performance(func: Optional[Callable] = None, *,
+                        profile_memory: Optional[bool] = None) -> Callable:
+    """Decorator to monitor function performance.
+
+    Memory profiling reads /proc twice per call, so it is opt-in via the
+    profile_memory argument or the NOVA_PROFILE_MEMORY=1 environment flag.
+    """
+    def decorate(fn: Callable) -> Callable:
+        track_memory = profile_memory
+        if track_memory is None:
+            track_memory = os.environ.get("NOVA_PROFILE_MEMORY") == "1"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start_time = time.time()
+            start_memory = (
+                psutil.Process().memory_info().rss / 1024 / 1024
+                if track_memory else 0.0
+            )
+
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if logger.isEnabledFor(logging.INFO):
+                    execution_time = time.time() - start_time
+                    if track_memory:
+                        end_memory = psutil.Process().memory_info().rss / 1024 / 1024
+                        logger.info(
+                            "Function %s executed in %.2fs, memory change: %+.2fMB",
+                            fn.__name__, execution_time, end_memory - start_memory)
+                    else:
+                        logger.info("Function %s executed in %.2fs",
+                                    fn.__name__, execution_time)
+
+        return wrapper
+
+    # Support both @monitor_performance and @monitor_performance(...)
+    if func is not None:
+        return decorate(func)
+    return decorate
 
 def log_metrics(metrics: PerformanceMetrics, session_id: str = None):
     """Log performance metrics."""
-    logger.info(f"Performance Metrics for session {session_id or 'unknown'}:")
-    logger.info(f"  Total Time: {metrics.total_time:.2f}s")
-    logger.info(f"  LLM Response Time: {metrics.llm_response_time:.2f}s")
-    logger.info(f"  Peak Memory: {metrics.peak_memory_mb:.2f}MB")
-    logger.info(f"  Model Used: {metrics.model_used}")
-    logger.info(f"  Tokens Generated: {metrics.tokens_generated}")
-    logger.info(f"  Iterations: {metrics.iterations_completed}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("Performance Metrics for session %s:", session_id or 'unknown')
+    logger.info("  Total Time: %.2fs", metrics.total_time)
+    logger.info("  LLM Response Time: %.2fs", metrics.llm_response_time)
+    logger.info("  Peak Memory: %.2fMB", metrics.peak_memory_mb)
+    logger.info("  Model Used: %s", metrics.model_used)
+    logger.info("  Tokens Generated: %d", metrics.tokens_generated)
+    logger.info("  Iterations: %d", metrics.iterations_completed)
 
 # Export main classes and functions
 __all__ = [
     'PerformanceMetrics',
+    'SessionSummary',
     'MetricsCollector',
     'get_metrics_collector',
     'monitor_performance',
@@ -24,6 +24,23 @@ Usage:
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 import json
+import math
+
+try:
+    import numpy as np
+except ImportError:  # optional accelerator; pure-Python fallback is used
+    np = None
+
+# Below this many matrix cells the cost of building ndarrays outweighs the
+# vectorized arithmetic, so the pure-Python path is used even when numpy is
+# installed. Typical interactive decisions (a handful of options x criteria)
+# fall under it.
+_SMALL_MATRIX_CELLS = 64
+
+
+def _use_numpy(n_options: int, n_criteria: int) -> bool:
+    """Whether the vectorized path pays off for a matrix of this size."""
+    return np is not None and n_options * n_criteria >= _SMALL_MATRIX_CELLS
 
 
 @dataclass
@@ -253,23 +270,28 @@ class DecisionMatrix:
                     f"scores but {len(self.criteria)} criteria"
                 )
 
-    def analyze(self) -> DecisionResult:
+    def analyze(self, method: Optional[str] = None) -> DecisionResult:
         """
         Perform decision matrix analysis.
 
+        Args:
+            method: Optional override of the method given at construction,
+                so one validated matrix can be analyzed several ways.
+
         Returns:
             DecisionResult with rankings and analysis
         """
-        if self.method == "weighted":
+        method = method or self.method
+        if method == "weighted":
             return self._analyze_weighted()
-        elif self.method == "normalized":
+        elif method == "normalized":
             return self._analyze_normalized()
-        elif self.method == "ranking":
+        elif method == "ranking":
             return self._analyze_ranking()
-        elif self.method == "best_worst":
+        elif method == "best_worst":
             return self._analyze_best_worst()
         else:
-            raise ValueError(f"Unknown analysis method: {self.method}")
+            raise ValueError(f"Unknown analysis method: {method}")
 
     def _analyze_weighted(self) -> DecisionResult:
         """Traditional weighted score analysis."""
@@ -277,21 +299,37 @@ class DecisionMatrix:
         breakdown = {}
 
         # Calculate weighted scores
-        for option in self.options:
-            option_scores = self.scores[option]
-            weighted_total = sum(
-                score * weight
-                for score, weight in zip(option_scores, self.weights)
+        if _use_numpy(len(self.options), len(self.criteria)):
+            # One matrix-vector product replaces the nested Python loops.
+            scores_arr = np.array(
+                [self.scores[option] for option in self.options], dtype=np.float64
             )
-            total_scores[option] = weighted_total
+            weights_arr = np.asarray(self.weights, dtype=np.float64)
+            totals = scores_arr @ weights_arr
+            weighted_rows = scores_arr * weights_arr
+        else:
+            # math.fsum is a single C-level, Kahan-compensated reduction --
+            # faster than the interpreter loop and stable for many criteria.
+            totals = [
+                math.fsum(
+                    score * weight
+                    for score, weight in zip(self.scores[option], self.weights)
+                )
+                for option in self.options
+            ]
+            weighted_rows = [
+                [score * weight for score, weight in zip(self.scores[option], self.weights)]
+                for option in self.options
+            ]
+
+        for option, weighted_total, row in zip(self.options, totals, weighted_rows):
+            total_scores[option] = float(weighted_total)
 
             # Build breakdown
-            breakdown[option] = {}
-            for i, criterion in enumerate(self.criteria):
-                weighted_score = option_scores[i] * self.weights[i]
-                breakdown[option][f"{criterion} (w={self.weights[i]:.2f})"] = (
-                    weighted_score
-                )
+            breakdown[option] = {
+                f"{criterion} (w={self.weights[i]:.2f})": float(row[i])
+                for i, criterion in enumerate(self.criteria)
+            }
 
         # Rank options
         rankings = sorted(
@@ -345,43 +383,60 @@ class DecisionMatrix:
 
     def _analyze_normalized(self) -> DecisionResult:
         """Normalized score analysis (0-100 scale per criterion)."""
-        normalized_scores = {}
         breakdown = {}
 
-        # Normalize each criterion to 0-100
-        for criterion_idx, criterion in enumerate(self.criteria):
-            criterion_scores = [
-                self.scores[opt][criterion_idx] for opt in self.options
-            ]
-            min_score = min(criterion_scores)
-            max_score = max(criterion_scores)
-            score_range = max_score - min_score if max_score > min_score else 1
-
-            for option in self.options:
-                raw_score = self.scores[option][criterion_idx]
-                normalized = ((raw_score - min_score) / score_range) * 100
-
-                if option not in normalized_scores:
-                    normalized_scores[option] = []
-                normalized_scores[option].append(normalized)
-
-        # Calculate weighted totals
-        total_scores = {}
-        for option in self.options:
-            weighted_total = sum(
-                score * weight
-                for score, weight in zip(
-                    normalized_scores[option], self.weights
-                )
+        if _use_numpy(len(self.options), len(self.criteria)):
+            # Column-wise min/max scaling and the weighted reduction are all
+            # whole-matrix operations: one pass instead of two nested loops.
+            scores_arr = np.array(
+                [self.scores[option] for option in self.options], dtype=np.float64
             )
-            total_scores[option] = weighted_total
+            mins = scores_arr.min(axis=0)
+            ranges = scores_arr.max(axis=0) - mins
+            ranges[ranges == 0] = 1
+            normalized_arr = (scores_arr - mins) / ranges * 100
+            totals = normalized_arr @ np.asarray(self.weights, dtype=np.float64)
+            normalized_scores = {
+                option: [float(v) for v in row]
+                for option, row in zip(self.options, normalized_arr)
+            }
+            total_scores = {
+                option: float(total) for option, total in zip(self.options, totals)
+            }
+        else:
+            normalized_scores = {}
 
-            # Build breakdown
-            breakdown[option] = {}
-            for i, criterion in enumerate(self.criteria):
-                breakdown[option][f"{criterion} (normalized)"] = (
-                    normalized_scores[option][i]
+            # Normalize each criterion to 0-100
+            for criterion_idx, criterion in enumerate(self.criteria):
+                criterion_scores = [
+                    self.scores[opt][criterion_idx] for opt in self.options
+                ]
+                min_score = min(criterion_scores)
+                max_score = max(criterion_scores)
+                score_range = max_score - min_score if max_score > min_score else 1
+
+                for option in self.options:
+                    raw_score = self.scores[option][criterion_idx]
+                    normalized = ((raw_score - min_score) / score_range) * 100
+
+                    if option not in normalized_scores:
+                        normalized_scores[option] = []
+                    normalized_scores[option].append(normalized)
+
+            total_scores = {
+                option: math.fsum(
+                    score * weight
+                    for score, weight in zip(normalized_scores[option], self.weights)
                 )
+                for option in self.options
+            }
+
+        # Build breakdown
+        for option in self.options:
+            breakdown[option] = {
+                f"{criterion} (normalized)": normalized_scores[option][i]
+                for i, criterion in enumerate(self.criteria)
+            }
 
         # Rank options
         rankings = sorted(
@@ -751,12 +806,12 @@ def make_decision(
         >>> print(result)
     """
     if show_all_methods:
+        # One matrix instance: validation and weight normalization happen
+        # once, then each method re-analyzes the same data.
+        matrix = DecisionMatrix(options, criteria, scores, weights)
         results = {}
         for method_name in ["weighted", "normalized", "ranking", "best_worst"]:
-            matrix = DecisionMatrix(
-                options, criteria, scores, weights, method_name
-            )
-            result = matrix.analyze()
+            result = matrix.analyze(method_name)
             result.top_n = top_n
             results[method_name] = result
         return results
@@ -767,16 +822,32 @@ def make_decision(
         return result
 
 
+@dataclass
+class ComparisonReport:
+    """Formatted method comparison plus the per-method results behind it.
+
+    Prints like the plain string it used to be, while ``per_method`` lets
+    callers reuse the already-computed :class:`DecisionResult` objects
+    instead of re-running each method.
+    """
+
+    per_method: Dict[str, DecisionResult]
+    text: str
+
+    def __str__(self) -> str:
+        return self.text
+
+
 def compare_methods(
     options: List[str],
     criteria: List[str],
     scores: Dict[str, List[Union[int, float]]],
     weights: Optional[List[float]] = None,
-) -> str:
+) -> ComparisonReport:
     """
     Compare results across all analysis methods.
 
-    Returns a formatted comparison of all methods.
+    Returns a ComparisonReport; printing it shows the formatted comparison.
     """
     results = make_decision(
         options, criteria, scores, weights, show_all_methods=True
@@ -805,4 +876,4 @@ def compare_methods(
     lines.append(f"CONSENSUS: {consensus[0]} ({consensus[1]}/4 methods)")
     lines.append("=" * 70)
 
-    return "\n".join(lines)
+    return ComparisonReport(per_method=results, text="\n".join(lines))
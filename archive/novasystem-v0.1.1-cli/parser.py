@@ -13,6 +13,11 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Precompiled once at import time so repeated parses skip the per-call
+# pattern-cache lookup inside the re module.
+_CODE_BLOCK_PATTERN = re.compile(r'```([a-zA-Z]*)\n([\s\S]*?)\n```')
+_INLINE_CODE_PATTERN = re.compile(r'`([^`]+)`')
+
 class CommandSource(Enum):
     """Source of an extracted command."""
     CODE_BLOCK = "code_block"
@@ -154,17 +159,20 @@ class DocumentationParser:
         # with capture groups for language and content
         code_blocks = []
 
-        # Pattern for fenced code blocks (```language\ncode```)
-        pattern = r'```([a-zA-Z]*)\n([\s\S]*?)\n```'
-        matches = re.finditer(pattern, content)
+        # Fenced code blocks (```language\ncode```). Matches stream in
+        # document order, so line numbers are tracked incrementally instead
+        # of recounting newlines from the top of the file per match.
+        line_number = 1
+        last_pos = 0
 
-        for match in matches:
+        for match in _CODE_BLOCK_PATTERN.finditer(content):
             language = match.group(1).lower()
             code = match.group(2).strip()
             start_pos = match.start()
 
             # Calculate line number
-            line_number = content[:start_pos].count('\n') + 1
+            line_number += content.count('\n', last_pos, start_pos)
+            last_pos = start_pos
 
             # Get context (text before the code block)
             context_start = max(0, start_pos - 200)
@@ -187,17 +195,13 @@ class DocumentationParser:
 
             # If it's a shell command, split by lines and process each command
             if command_type == CommandType.SHELL:
-                for i, line in enumerate(code.split('\n')):
-                    line = line.strip()
-
+                for i, raw_line in enumerate(code.splitlines()):
                     # Skip empty lines and comments
-                    if not line or line.startswith('#'):
+                    if not (line := raw_line.strip()) or line.startswith('#'):
                         continue
 
                     # Skip command prompts
-                    if line.startswith('$ '):
-                        line = line[2:].strip()
-                    elif line.startswith('> '):
+                    if line.startswith(('$ ', '> ')):
                         line = line[2:].strip()
 
                     # Skip lines that don't look like commands
@@ -248,16 +252,18 @@ class DocumentationParser:
         """
         inline_commands = []
 
-        # Pattern for inline code (`code`)
-        pattern = r'`([^`]+)`'
-        matches = re.finditer(pattern, content)
+        # Inline code (`code`), with the same incremental line tracking as
+        # the code-block pass.
+        line_number = 1
+        last_pos = 0
 
-        for match in matches:
+        for match in _INLINE_CODE_PATTERN.finditer(content):
             code = match.group(1).strip()
             start_pos = match.start()
 
             # Calculate line number
-            line_number = content[:start_pos].count('\n') + 1
+            line_number += content.count('\n', last_pos, start_pos)
+            last_pos = start_pos
 
             # Get context (text around the inline code)
             context_start = max(0, start_pos - 100)
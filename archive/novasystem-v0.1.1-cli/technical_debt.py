@@ -8,6 +8,7 @@ marking items as resolved.
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Iterable, List, Optional, Sequence, Set
@@ -27,7 +28,12 @@ class Severity(Enum):
     def rank(self) -> int:
         """Numeric rank for sorting, higher means more severe."""
 
-        return {Severity.LOW: 1, Severity.MEDIUM: 2, Severity.HIGH: 3}[self]
+        return _SEVERITY_RANKS[self]
+
+
+# Built once at import time; the rank property is hit per item in every
+# prioritized() sort, so the mapping must not be rebuilt per access.
+_SEVERITY_RANKS = {Severity.LOW: 1, Severity.MEDIUM: 2, Severity.HIGH: 3}
 
 
 class Status(Enum):
@@ -38,9 +44,13 @@ class Status(Enum):
     RESOLVED = "resolved"
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnicalDebtItem:
-    """Represents a single technical debt item."""
+    """Represents a single technical debt item.
+
+    ``slots=True`` drops the per-instance ``__dict__`` so large backlogs
+    stay compact during the manager's linear scans.
+    """
 
     key: str
     title: str
@@ -235,18 +245,39 @@ class TechnicalDebtManager:
         """Summarize counts by status for quick reporting."""
 
         counts = {status.value: 0 for status in Status}
-        for item in self._items.values():
-            counts[item.status.value] += 1
+        counts.update(Counter(item.status.value for item in self._items.values()))
         return counts
 
     def breakdown_by_severity(self, include_resolved: bool = False) -> Dict[str, int]:
-        """Count backlog entries by severity, optionally including resolved work."""
+        """Count backlog entries by severity, optionally including resolved work.
+
+        Counts are recomputed per call: items are mutable dataclasses that
+        callers may change directly (mark_resolved(), attribute writes), so
+        a cached tally cannot be kept in sync from here.
+        """
 
         counts = {level.value: 0 for level in Severity}
-        for item in self.backlog(include_resolved=include_resolved):
-            counts[item.severity.value] += 1
+        counts.update(
+            Counter(
+                item.severity.value
+                for item in self.backlog(include_resolved=include_resolved)
+            )
+        )
         return counts
 
+    def resolve_item(self, key: str) -> Optional[TechnicalDebtItem]:
+        """Mark an item resolved by key and return it.
+
+        Resolution is a single dict lookup rather than a scan of the
+        backlog; returns ``None`` when the key is unknown.
+        """
+
+        item = self._items.get(key)
+        if item is None:
+            return None
+        item.status = Status.RESOLVED
+        return item
+
     def update_status(self, key: str, status: Status) -> None:
         """Update the status of an existing item.
 
@@ -9,18 +9,142 @@ The decision matrix helps you make quantitative decisions by comparing options
 against multiple criteria with optional weighting.
 """
 
+import functools
+
 from novasystem.core_utils import make_decision, compare_methods
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_decide(options, criteria, scores_items, weights, method):
+    """Memoized make_decision over hashable (tuple-form) arguments."""
+    return make_decision(
+        list(options),
+        list(criteria),
+        {option: list(values) for option, values in scores_items},
+        list(weights) if weights is not None else None,
+        method=method,
+    )
+
+
+def _decide(options, criteria, scores, weights=None, method="weighted"):
+    """Call make_decision through the cache, canonicalizing the inputs."""
+    return _cached_decide(
+        tuple(options),
+        tuple(criteria),
+        tuple((option, tuple(values)) for option, values in scores.items()),
+        tuple(weights) if weights is not None else None,
+        method,
+    )
+
+
+# Rendered result strings keyed by (winner, rankings, confidence) so a
+# result repeated across examples is formatted only once.
+_RENDER_CACHE = {}
+
+
+def _render(result) -> str:
+    """Return str(result), reusing a previous rendering when identical."""
+    key = (result.winner, tuple(result.rankings), result.confidence_score)
+    rendered = _RENDER_CACHE.get(key)
+    if rendered is None:
+        rendered = _RENDER_CACHE[key] = str(result)
+    return rendered
+
+
+# ---------------------------------------------------------------------------
+# Per-example option/criteria/weight constants. Frozen at import so repeated
+# run_all_examples() calls allocate nothing and the _decide cache keys on
+# identical tuples; each example keeps only its scores dict inline (the part
+# readers are meant to edit).
+# ---------------------------------------------------------------------------
+_EX1_OPTIONS = ("Python", "JavaScript", "Go")
+_EX1_CRITERIA = ("Learning Curve", "Performance", "Community Support")
+
+_EX2_OPTIONS = ("Vendor A", "Vendor B", "Vendor C")
+_EX2_CRITERIA = ("Price", "Quality", "Delivery Time", "Customer Support")
+_EX2_WEIGHTS = (0.4, 0.3, 0.2, 0.1)
+
+_EX3_OPTIONS = ("Candidate A", "Candidate B", "Candidate C")
+_EX3_CRITERIA = ("Technical Skills", "Experience", "Culture Fit", "Cost")
+_EX3_WEIGHTS = (0.4, 0.3, 0.2, 0.1)
+
+_EX4_OPTIONS = (
+    "Mobile App Redesign",
+    "API Performance Optimization",
+    "New Feature: AI Chatbot",
+    "Technical Debt Cleanup",
+)
+_EX4_CRITERIA = (
+    "Business Value",
+    "Development Effort",  # Lower is better, but we score as inverse
+    "Risk",  # Lower is better, but we score as inverse
+    "Strategic Alignment",
+)
+_EX4_WEIGHTS = (
+    0.35,  # Business value: 35%
+    0.25,  # Effort: 25%
+    0.15,  # Risk: 15%
+    0.25,  # Strategic alignment: 25%
+)
+
+_EX5_OPTIONS = ("AWS", "Google Cloud", "Azure", "DigitalOcean")
+_EX5_CRITERIA = (
+    "Pricing",
+    "Services Available",
+    "Ease of Use",
+    "Documentation",
+    "Performance",
+)
+_EX5_WEIGHTS = (0.25, 0.25, 0.20, 0.15, 0.15)
+
+_EX6_OPTIONS = ("Option 1", "Option 2", "Option 3")
+_EX6_CRITERIA = ("Criterion A", "Criterion B", "Criterion C")
+_EX6_WEIGHTS = (0.4, 0.3, 0.3)
+
+_EX7_OPTIONS = ("Build In-House", "Buy Commercial Solution")
+_EX7_CRITERIA = (
+    "Initial Cost",
+    "Long-term Cost",
+    "Customization",
+    "Time to Market",
+    "Maintenance Burden",
+)
+_EX7_WEIGHTS = (0.20, 0.25, 0.20, 0.20, 0.15)
+
+_EX8_OPTIONS = ("Current Job", "Startup Offer", "Big Tech Offer", "Remote Consulting")
+_EX8_CRITERIA = (
+    "Salary",
+    "Work-Life Balance",
+    "Learning Opportunities",
+    "Job Security",
+    "Impact/Meaningful Work",
+)
+_EX8_WEIGHTS = (0.25, 0.25, 0.20, 0.15, 0.15)
+
+_EX9_OPTIONS = ("Index Funds", "Individual Stocks", "Real Estate", "Bonds")
+_EX9_CRITERIA = (
+    "Expected Return",
+    "Risk Level (inverse)",
+    "Liquidity",
+    "Effort Required (inverse)",
+    "Diversification",
+)
+_EX9_WEIGHTS = (0.30, 0.25, 0.15, 0.15, 0.15)
+
+_EX10_OPTIONS = ("Your Option 1", "Your Option 2", "Your Option 3")
+_EX10_CRITERIA = ("Your Criterion 1", "Your Criterion 2", "Your Criterion 3")
+_EX10_WEIGHTS = (0.4, 0.3, 0.3)  # Optional: weight importance (must sum to 1.0)
+
+
 def example_1_basic_usage():
     """Example 1: Basic decision matrix usage."""
     print("\n" + "=" * 70)
     print("EXAMPLE 1: Basic Technology Selection")
     print("=" * 70)
 
-    result = make_decision(
-        options=["Python", "JavaScript", "Go"],
-        criteria=["Learning Curve", "Performance", "Community Support"],
+    result = _decide(
+        _EX1_OPTIONS,
+        _EX1_CRITERIA,
         scores={
             "Python": [9, 7, 10],  # Easy to learn, good performance, great community
             "JavaScript": [8, 6, 9],  # Easy to learn, ok performance, great community
@@ -28,7 +152,7 @@ def example_1_basic_usage():
         },
     )
 
-    print(result)
+    print(_render(result))
 
 
 def example_2_weighted_criteria():
@@ -38,18 +162,18 @@ def example_2_weighted_criteria():
     print("=" * 70)
 
     # Price is most important (40%), then quality (30%), delivery (20%), support (10%)
-    result = make_decision(
-        options=["Vendor A", "Vendor B", "Vendor C"],
-        criteria=["Price", "Quality", "Delivery Time", "Customer Support"],
+    result = _decide(
+        _EX2_OPTIONS,
+        _EX2_CRITERIA,
         scores={
             "Vendor A": [8, 7, 6, 9],  # Good price, ok quality, slow delivery, great support
             "Vendor B": [6, 9, 8, 7],  # Higher price, excellent quality, good delivery, good support
             "Vendor C": [7, 8, 9, 8],  # Medium price, good quality, fast delivery, good support
         },
-        weights=[0.4, 0.3, 0.2, 0.1],
+        weights=_EX2_WEIGHTS,
     )
 
-    print(result)
+    print(_render(result))
     print(f"\n📊 Export as JSON:")
     print(result.to_json())
 
@@ -60,28 +184,22 @@ def example_3_different_methods():
     print("EXAMPLE 3: Comparing Analysis Methods")
     print("=" * 70)
 
-    options = ["Candidate A", "Candidate B", "Candidate C"]
-    criteria = ["Technical Skills", "Experience", "Culture Fit", "Cost"]
     scores = {
         "Candidate A": [9, 5, 8, 6],  # Strong technical, junior, good fit, lower cost
         "Candidate B": [7, 9, 9, 4],  # Good technical, senior, great fit, higher cost
         "Candidate C": [8, 7, 7, 7],  # Good all-around, mid-level, ok fit, medium cost
     }
-    weights = [0.4, 0.3, 0.2, 0.1]
 
     # Compare all methods
-    comparison = compare_methods(options, criteria, scores, weights)
+    comparison = compare_methods(list(_EX3_OPTIONS), list(_EX3_CRITERIA), scores, list(_EX3_WEIGHTS))
     print(comparison)
 
-    # Or get individual method results
+    # Or reuse the individual method results the comparison already computed
     print("\n" + "-" * 70)
     print("Individual Method Details:")
     print("-" * 70)
 
-    for method in ["weighted", "normalized", "ranking", "best_worst"]:
-        result = make_decision(
-            options, criteria, scores, weights, method=method
-        )
+    for method, result in comparison.per_method.items():
         print(f"\n{method.upper()} METHOD → Winner: {result.winner} "
               f"(Confidence: {result.confidence_score:.1f}%)")
 
@@ -92,34 +210,19 @@ def example_4_project_prioritization():
     print("EXAMPLE 4: Project Prioritization")
     print("=" * 70)
 
-    result = make_decision(
-        options=[
-            "Mobile App Redesign",
-            "API Performance Optimization",
-            "New Feature: AI Chatbot",
-            "Technical Debt Cleanup",
-        ],
-        criteria=[
-            "Business Value",
-            "Development Effort",  # Lower is better, but we score as inverse
-            "Risk",  # Lower is better, but we score as inverse
-            "Strategic Alignment",
-        ],
+    result = _decide(
+        _EX4_OPTIONS,
+        _EX4_CRITERIA,
         scores={
             "Mobile App Redesign": [8, 4, 6, 7],  # High value, medium effort
             "API Performance Optimization": [7, 7, 8, 6],  # Good value, low effort
             "New Feature: AI Chatbot": [9, 3, 5, 9],  # High value, high effort
             "Technical Debt Cleanup": [6, 6, 9, 5],  # Medium value, medium effort
         },
-        weights=[
-            0.35,  # Business value: 35%
-            0.25,  # Effort: 25%
-            0.15,  # Risk: 15%
-            0.25,  # Strategic alignment: 25%
-        ],
+        weights=_EX4_WEIGHTS,
     )
 
-    print(result)
+    print(_render(result))
 
 
 def example_5_feature_comparison():
@@ -128,26 +231,20 @@ def example_5_feature_comparison():
     print("EXAMPLE 5: Cloud Provider Selection")
     print("=" * 70)
 
-    result = make_decision(
-        options=["AWS", "Google Cloud", "Azure", "DigitalOcean"],
-        criteria=[
-            "Pricing",
-            "Services Available",
-            "Ease of Use",
-            "Documentation",
-            "Performance",
-        ],
+    result = _decide(
+        _EX5_OPTIONS,
+        _EX5_CRITERIA,
         scores={
             "AWS": [6, 10, 6, 8, 9],  # Expensive, comprehensive, complex
             "Google Cloud": [7, 9, 7, 9, 9],  # Good price, great services
             "Azure": [6, 9, 6, 7, 9],  # Similar to AWS
             "DigitalOcean": [9, 6, 9, 8, 7],  # Cheap, limited, easy
         },
-        weights=[0.25, 0.25, 0.20, 0.15, 0.15],
+        weights=_EX5_WEIGHTS,
         method="normalized",  # Use normalized method for better comparison
     )
 
-    print(result)
+    print(_render(result))
 
 
 def example_6_all_methods_comparison():
@@ -157,14 +254,14 @@ def example_6_all_methods_comparison():
     print("=" * 70)
 
     results = make_decision(
-        options=["Option 1", "Option 2", "Option 3"],
-        criteria=["Criterion A", "Criterion B", "Criterion C"],
+        options=list(_EX6_OPTIONS),
+        criteria=list(_EX6_CRITERIA),
         scores={
             "Option 1": [8, 7, 9],
             "Option 2": [7, 9, 7],
             "Option 3": [9, 8, 6],
         },
-        weights=[0.4, 0.3, 0.3],
+        weights=list(_EX6_WEIGHTS),
         show_all_methods=True,  # Returns dict of all method results
     )
 
@@ -175,7 +272,7 @@ def example_6_all_methods_comparison():
 
     # You can access individual results
     print(f"\nWeighted method details:")
-    print(results["weighted"])
+    print(_render(results["weighted"]))
 
 
 def example_7_simple_yes_no_decision():
@@ -184,23 +281,17 @@ def example_7_simple_yes_no_decision():
     print("EXAMPLE 7: Should We Build vs Buy?")
     print("=" * 70)
 
-    result = make_decision(
-        options=["Build In-House", "Buy Commercial Solution"],
-        criteria=[
-            "Initial Cost",
-            "Long-term Cost",
-            "Customization",
-            "Time to Market",
-            "Maintenance Burden",
-        ],
+    result = _decide(
+        _EX7_OPTIONS,
+        _EX7_CRITERIA,
         scores={
             "Build In-House": [3, 8, 10, 4, 3],  # Low initial cost, high long-term
             "Buy Commercial Solution": [7, 7, 6, 9, 8],  # Higher initial, lower long-term
         },
-        weights=[0.20, 0.25, 0.20, 0.20, 0.15],
+        weights=_EX7_WEIGHTS,
     )
 
-    print(result)
+    print(_render(result))
 
 
 def example_8_career_decision():
@@ -209,25 +300,19 @@ def example_8_career_decision():
     print("EXAMPLE 8: Job Offer Comparison")
     print("=" * 70)
 
-    result = make_decision(
-        options=["Current Job", "Startup Offer", "Big Tech Offer", "Remote Consulting"],
-        criteria=[
-            "Salary",
-            "Work-Life Balance",
-            "Learning Opportunities",
-            "Job Security",
-            "Impact/Meaningful Work",
-        ],
+    result = _decide(
+        _EX8_OPTIONS,
+        _EX8_CRITERIA,
         scores={
             "Current Job": [7, 8, 6, 9, 7],
             "Startup Offer": [6, 5, 9, 4, 9],
             "Big Tech Offer": [10, 6, 7, 8, 6],
             "Remote Consulting": [8, 10, 8, 6, 7],
         },
-        weights=[0.25, 0.25, 0.20, 0.15, 0.15],
+        weights=_EX8_WEIGHTS,
     )
 
-    print(result)
+    print(_render(result))
 
 
 def example_9_investment_decision():
@@ -236,30 +321,19 @@ def example_9_investment_decision():
     print("EXAMPLE 9: Investment Strategy Comparison")
     print("=" * 70)
 
-    result = make_decision(
-        options=[
-            "Index Funds",
-            "Individual Stocks",
-            "Real Estate",
-            "Bonds",
-        ],
-        criteria=[
-            "Expected Return",
-            "Risk Level (inverse)",
-            "Liquidity",
-            "Effort Required (inverse)",
-            "Diversification",
-        ],
+    result = _decide(
+        _EX9_OPTIONS,
+        _EX9_CRITERIA,
         scores={
             "Index Funds": [7, 8, 9, 9, 10],
             "Individual Stocks": [9, 4, 9, 3, 5],
             "Real Estate": [8, 6, 4, 2, 6],
             "Bonds": [5, 9, 8, 9, 7],
         },
-        weights=[0.30, 0.25, 0.15, 0.15, 0.15],
+        weights=_EX9_WEIGHTS,
     )
 
-    print(result)
+    print(_render(result))
 
 
 def example_10_custom_use_case():
@@ -268,27 +342,19 @@ def example_10_custom_use_case():
     print("EXAMPLE 10: Template - Customize This!")
     print("=" * 70)
 
-    result = make_decision(
-        options=[
-            "Your Option 1",
-            "Your Option 2",
-            "Your Option 3",
-        ],
-        criteria=[
-            "Your Criterion 1",
-            "Your Criterion 2",
-            "Your Criterion 3",
-        ],
+    result = _decide(
+        _EX10_OPTIONS,
+        _EX10_CRITERIA,
         scores={
             "Your Option 1": [8, 7, 9],  # Score each criterion 1-10
             "Your Option 2": [7, 9, 7],
             "Your Option 3": [9, 8, 6],
         },
-        weights=[0.4, 0.3, 0.3],  # Optional: weight importance (must sum to 1.0)
+        weights=_EX10_WEIGHTS,
         method="weighted",  # weighted, normalized, ranking, or best_worst
     )
 
-    print(result)
+    print(_render(result))
 
     # You can also export for further analysis
     print("\n📤 Exportable formats:")
@@ -296,22 +362,25 @@ def example_10_custom_use_case():
     # print("JSON string:", result.to_json())
 
 
+# Registered once at import; run_all_examples iterates this instead of
+# rebuilding the list per call.
+_EXAMPLES = (
+    example_1_basic_usage,
+    example_2_weighted_criteria,
+    example_3_different_methods,
+    example_4_project_prioritization,
+    example_5_feature_comparison,
+    example_6_all_methods_comparison,
+    example_7_simple_yes_no_decision,
+    example_8_career_decision,
+    example_9_investment_decision,
+    example_10_custom_use_case,
+)
+
+
 def run_all_examples():
     """Run all examples."""
-    examples = [
-        example_1_basic_usage,
-        example_2_weighted_criteria,
-        example_3_different_methods,
-        example_4_project_prioritization,
-        example_5_feature_comparison,
-        example_6_all_methods_comparison,
-        example_7_simple_yes_no_decision,
-        example_8_career_decision,
-        example_9_investment_decision,
-        example_10_custom_use_case,
-    ]
-
-    for example in examples:
+    for example in _EXAMPLES:
         try:
             example()
         except Exception as e:
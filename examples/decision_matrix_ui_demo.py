@@ -13,16 +13,32 @@ Run:
 
 import json
 import logging
+import sys
 import textwrap
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 from novasystem.tools.decision_matrix.decision_matrix import DecisionMatrix, make_decision
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json with compact separators is used
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize a journal entry compactly (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
 BASE_DIR = Path(__file__).resolve().parent
 LOG_PATH = BASE_DIR / "logs" / "decision_matrix_ui_demo.log"
-JOURNAL_PATH = BASE_DIR / "data" / "decision_journal.json"
+JOURNAL_PATH = BASE_DIR / "data" / "decision_journal.jsonl"
+_LEGACY_JOURNAL_PATH = BASE_DIR / "data" / "decision_journal.json"
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +47,12 @@ JOURNAL_PATH = BASE_DIR / "data" / "decision_journal.json"
 def setup_logging() -> logging.Logger:
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+    # This demo logs heavily; skip the per-record thread/process ident
+    # lookups LogRecord performs by default.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger = logging.getLogger("nova.decision_demo")
     logger.setLevel(logging.DEBUG)
     logger.handlers.clear()
@@ -53,27 +75,48 @@ def setup_logging() -> logging.Logger:
     return logger
 
 
-def load_journal() -> List[Dict]:
-    if not JOURNAL_PATH.exists():
-        return []
+def _migrate_legacy_journal() -> None:
+    """One-shot conversion of the old JSON-array journal to JSONL."""
+    if JOURNAL_PATH.exists() or not _LEGACY_JOURNAL_PATH.exists():
+        return
     try:
-        with JOURNAL_PATH.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        with _LEGACY_JOURNAL_PATH.open("r", encoding="utf-8") as f:
+            legacy = json.load(f)
     except json.JSONDecodeError:
+        return
+    with JOURNAL_PATH.open("w", encoding="utf-8") as f:
+        f.writelines(_dumps(entry) + "\n" for entry in legacy)
+
+
+def load_journal() -> List[Dict]:
+    """Read the JSONL journal, skipping any malformed lines."""
+    _migrate_legacy_journal()
+    if not JOURNAL_PATH.exists():
         return []
+    entries = []
+    with JOURNAL_PATH.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
 
 
 def save_journal(entries: List[Dict]) -> None:
     JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
     with JOURNAL_PATH.open("w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2)
+        f.writelines(_dumps(entry) + "\n" for entry in entries)
 
 
-def append_journal_entry(entry: Dict) -> List[Dict]:
-    entries = load_journal()
-    entries.append(entry)
-    save_journal(entries)
-    return entries
+def append_journal_entry(entry: Dict) -> None:
+    """Append one entry; JSONL makes this O(1) instead of a full rewrite."""
+    JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with JOURNAL_PATH.open("a", encoding="utf-8") as f:
+        f.write(_dumps(entry) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -84,14 +127,16 @@ def build_dataset(history: List[Dict]) -> Tuple[List[str], List[str], Dict[str,
     Build a rich comparison dataset. We keep scores on a 0-10 scale for clarity.
     The historical journal influences the "Historical Trust" criterion.
     """
-    options = [
+    # Interned so every downstream dict lookup on these keys (the decision
+    # library, the win tally) compares by pointer identity.
+    options = [sys.intern(option) for option in (
         "PixelLab Nova",
         "GPT-4.1 Enterprise",
         "Claude 3.5 Sonnet",
         "Gemini 2.0 Advanced",
         "Mistral Large",
         "Cohere Command R+",
-    ]
+    )]
 
     criteria_with_weights = [
         ("Latency (lower is better)", 0.08),
@@ -117,14 +162,17 @@ def build_dataset(history: List[Dict]) -> Tuple[List[str], List[str], Dict[str,
         "Cohere Command R+":      [8.4, 8.8, 8.7, 8.6, 8.4, 9.3, 9.0, 8.5, 8.5],
     }
 
-    # Incorporate historical trust as a new criterion
+    # Incorporate historical trust as a new criterion. Score rows are built
+    # in one pass with the bonus column appended, rather than mutating the
+    # baseline lists after the fact, and criteria/weights unzip in a single
+    # traversal of the pair list.
     criteria_with_weights.append(("Historical Trust (journal)", 0.10))
-    for option in options:
-        base_scores[option].append(history_bonus.get(option, 5.0))
-
-    criteria = [c for c, _ in criteria_with_weights]
-    weights = [w for _, w in criteria_with_weights]
-    return options, criteria, base_scores, weights, history_bonus
+    scores = {
+        option: base_scores[option] + [history_bonus.get(option, 5.0)]
+        for option in options
+    }
+    criteria, weights = (list(column) for column in zip(*criteria_with_weights))
+    return options, criteria, scores, weights, history_bonus
 
 
 def compute_history_bonus(options: List[str], history: List[Dict]) -> Dict[str, float]:
@@ -132,19 +180,22 @@ def compute_history_bonus(options: List[str], history: List[Dict]) -> Dict[str,
     Derive a 0-10 "trust" bonus from prior journal entries (how often each option won).
     The bonus is lightly normalized to keep influence bounded.
     """
-    wins = {opt: 0 for opt in options}
-    for entry in history:
-        winner = entry.get("winner")
-        if winner in wins:
-            wins[winner] += 1
+    # Counter walks the history in C; winners outside the option list are
+    # simply never looked up. Journal strings are fresh allocations per
+    # load, so interning them lets the tally share identity with the
+    # interned option names.
+    win_counts = Counter(
+        sys.intern(winner)
+        for entry in history
+        if isinstance(winner := entry.get("winner"), str)
+    )
+    total_wins = sum(win_counts[opt] for opt in options) or 1
 
-    total_wins = sum(wins.values()) or 1
-    bonus = {}
-    for opt, count in wins.items():
-        # Center around 5.0 baseline; add up to +5 based on share of wins.
-        share = count / total_wins
-        bonus[opt] = round(5.0 + (share * 5.0), 2)
-    return bonus
+    # Center around 5.0 baseline; add up to +5 based on share of wins.
+    return {
+        opt: round(5.0 + (win_counts[opt] / total_wins) * 5.0, 2)
+        for opt in options
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -211,14 +262,18 @@ def run_demo():
     weighted = all_results["weighted"]
 
     logger.info("Weighted winner: %s (confidence %.1f%%)", weighted.winner, weighted.confidence_score)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     for method_name, result in all_results.items():
         logger.info("[%s] Winner=%s • Confidence=%.1f%%", method_name, result.winner, result.confidence_score)
-        for opt, score in result.rankings:
-            logger.debug("[%s] %-22s -> %.3f", method_name, opt, score)
+        if debug_enabled:
+            for opt, score in result.rankings:
+                logger.debug("[%s] %-22s -> %.3f", method_name, opt, score)
 
-    # UI-ish console output
+    # UI-ish console output. One tz-aware clock read serves both the session
+    # header and the journal timestamp below.
+    now = datetime.now(timezone.utc)
     print_header()
-    print(f"Session: DM-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+    print(f"Session: DM-{now.astimezone().strftime('%Y%m%d-%H%M%S')}")
     print(f"Winner (weighted): {weighted.winner}  | Confidence: {weighted.confidence_score:.1f}%")
     if weighted.warnings:
         print("\nWarnings:")
@@ -237,7 +292,7 @@ def run_demo():
 
     # Persist to journal
     entry = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now.isoformat(),
         "winner": weighted.winner,
         "confidence": round(weighted.confidence_score, 2),
         "method": "weighted",
@@ -245,7 +300,11 @@ def run_demo():
         "history_bonus": history_bonus,
         "notes": "Demo run - generated with synthetic provider metrics and historical trust signal.",
     }
-    updated_journal = append_journal_entry(entry)
+    append_journal_entry(entry)
+    # The file was only touched by the append above, so the in-memory
+    # history plus the new entry is the up-to-date journal -- no reload.
+    history.append(entry)
+    updated_journal = history
     logger.info("Journal updated; total entries now %d", len(updated_journal))
 
     # Show a concise recap that a UI might show in a footer
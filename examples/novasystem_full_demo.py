@@ -22,10 +22,17 @@ Run:
 
 import argparse
 import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -54,9 +61,16 @@ from novasystem.domain.models import (
 )
 from novasystem.domain.pipeline import Pipeline, PipelineStepBase, StepResult, SummarizeStep
 from novasystem.domain.state_machine import RunStateMachine
-from novasystem.core.memory import MemoryManager
-from novasystem.core.vector_store import LocalVectorStore
-from novasystem.tools.decision_matrix.decision_matrix import DecisionMatrix, make_decision
+
+# novasystem.core and the decision-matrix library are imported lazily at
+# first use (run_demo / MakeDecisionStep.execute); the domain imports
+# above must stay module-level because the step and logger classes are
+# defined against them.
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used
+    orjson = None
 
 # =============================================================================
 # Configuration
@@ -126,7 +140,6 @@ def setup_logging(verbose: bool = False, log_dir: Optional[Path] = None) -> logg
         datefmt="%H:%M:%S"
     )
     console_handler.setFormatter(console_fmt)
-    logger.addHandler(console_handler)
 
     # File handler with detailed format
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
@@ -136,7 +149,19 @@ def setup_logging(verbose: bool = False, log_dir: Optional[Path] = None) -> logg
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     file_handler.setFormatter(file_fmt)
-    logger.addHandler(file_handler)
+
+    # Both handlers sit behind a queue: a log call on the solve path is
+    # an O(1) enqueue, with formatting and console/file I/O happening on
+    # the listener's background thread.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger.queue_listener = listener  # so callers can stop() it explicitly
+    atexit.register(listener.stop)
 
     logger.info(f"Logging initialized. Log file: {log_file}")
     return logger
@@ -147,6 +172,20 @@ def setup_logging(verbose: bool = False, log_dir: Optional[Path] = None) -> logg
 # =============================================================================
 
 
+def _journal_loads(data: str) -> List[Dict]:
+    """Parse journal JSON (orjson's C parser when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _journal_dumps(entries: List[Dict]) -> str:
+    """Serialize journal JSON; orjson handles datetime natively."""
+    if orjson is not None:
+        return orjson.dumps(entries, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(entries, indent=2, default=str)
+
+
 def load_journal() -> List[Dict]:
     """Load historical journal entries."""
     JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -154,8 +193,8 @@ def load_journal() -> List[Dict]:
         return []
     try:
         with JOURNAL_PATH.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+            return _journal_loads(f.read())
+    except ValueError:  # covers json and orjson decode errors
         return []
 
 
@@ -163,7 +202,7 @@ def save_journal(entries: List[Dict]) -> None:
     """Persist journal entries."""
     JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
     with JOURNAL_PATH.open("w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2, default=str)
+        f.write(_journal_dumps(entries))
 
 
 def append_journal_entry(entry: Dict) -> List[Dict]:
@@ -179,101 +218,152 @@ def append_journal_entry(entry: Dict) -> List[Dict]:
 # =============================================================================
 
 
+@dataclass(slots=True)
+class EventRecord:
+    """One tracked event; slots keep the per-event footprint small."""
+    type: str
+    timestamp: Any  # datetime from the event, or epoch float fallback
+    run_id: Optional[int]
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
 class EventLogger:
     """Comprehensive event logger that tracks all system events."""
 
+    # Ring-buffer size: long runs keep the most recent events instead of
+    # growing without bound.
+    MAX_EVENTS = 10_000
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
-        self.events: List[Dict] = []
-        self.metrics = {
-            "total_events": 0,
-            "by_type": {},
-            "commands_executed": 0,
-            "commands_failed": 0,
-            "steps_completed": 0,
-            "steps_failed": 0,
+        self.events: deque = deque(maxlen=self.MAX_EVENTS)
+        self.by_type: Counter = Counter()
+        self.total_events = 0
+        self.commands_executed = 0
+        self.commands_failed = 0
+        self.steps_completed = 0
+        self.steps_failed = 0
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Plain-dict view of the counters (journal-serializable)."""
+        return {
+            "total_events": self.total_events,
+            "by_type": dict(self.by_type),
+            "commands_executed": self.commands_executed,
+            "commands_failed": self.commands_failed,
+            "steps_completed": self.steps_completed,
+            "steps_failed": self.steps_failed,
         }
 
-    def log_event(self, event):
-        """Log and track an event."""
-        event_type = type(event).__name__
-        self.metrics["total_events"] += 1
-        self.metrics["by_type"][event_type] = self.metrics["by_type"].get(event_type, 0) + 1
-
-        event_record = {
-            "type": event_type,
-            "timestamp": event.timestamp.isoformat() if hasattr(event, "timestamp") else datetime.now().isoformat(),
-            "run_id": getattr(event, "run_id", None),
-        }
+    # --- Per-type handlers (dispatched by exact event type below) ---
 
-        if isinstance(event, RunStatusChanged):
+    def _on_run_status(self, event, extra):
+        self.logger.info(
+            f"📊 RUN {event.run_id}: {event.old_status} → {event.new_status} "
+            f"(reason: {event.reason})"
+        )
+        extra["old_status"] = event.old_status
+        extra["new_status"] = event.new_status
+        extra["reason"] = event.reason
+
+    def _on_step_started(self, event, extra):
+        attempt = event.metadata.get("attempt", 1)
+        self.logger.info(f"🚀 STEP '{event.step_name}' started (attempt {attempt})")
+        extra["step_name"] = event.step_name
+        extra["attempt"] = attempt
+
+    def _on_step_completed(self, event, extra):
+        self.steps_completed += 1
+        self.logger.info(
+            f"✅ STEP '{event.step_name}' completed in {event.duration:.3f}s"
+        )
+        extra["step_name"] = event.step_name
+        extra["duration"] = event.duration
+
+    def _on_step_failed(self, event, extra):
+        self.steps_failed += 1
+        self.logger.error(f"❌ STEP '{event.step_name}' FAILED: {event.error}")
+        extra["step_name"] = event.step_name
+        extra["error"] = event.error
+
+    def _on_command_queued(self, event, extra):
+        self.logger.debug(f"📋 CMD queued: {event.command[:60]}...")
+        extra["command"] = event.command
+
+    def _on_command_started(self, event, extra):
+        self.logger.info(f"▶️  CMD started: {event.command[:60]}...")
+        extra["command"] = event.command
+
+    def _on_command_completed(self, event, extra):
+        if event.exit_code == 0:
+            self.commands_executed += 1
             self.logger.info(
-                f"📊 RUN {event.run_id}: {event.old_status} → {event.new_status} "
-                f"(reason: {event.reason})"
+                f"✅ CMD completed: {event.command[:40]}... "
+                f"(exit={event.exit_code}, time={event.execution_time:.2f}s)"
             )
-            event_record["old_status"] = event.old_status
-            event_record["new_status"] = event.new_status
-            event_record["reason"] = event.reason
-
-        elif isinstance(event, StepStarted):
-            attempt = event.metadata.get("attempt", 1)
-            self.logger.info(f"🚀 STEP '{event.step_name}' started (attempt {attempt})")
-            event_record["step_name"] = event.step_name
-            event_record["attempt"] = attempt
-
-        elif isinstance(event, StepCompleted):
-            self.metrics["steps_completed"] += 1
-            self.logger.info(
-                f"✅ STEP '{event.step_name}' completed in {event.duration:.3f}s"
+        else:
+            self.commands_failed += 1
+            self.logger.warning(
+                f"⚠️  CMD failed: {event.command[:40]}... "
+                f"(exit={event.exit_code}, error={event.error[:50]})"
             )
-            event_record["step_name"] = event.step_name
-            event_record["duration"] = event.duration
-
-        elif isinstance(event, StepFailed):
-            self.metrics["steps_failed"] += 1
-            self.logger.error(f"❌ STEP '{event.step_name}' FAILED: {event.error}")
-            event_record["step_name"] = event.step_name
-            event_record["error"] = event.error
-
-        elif isinstance(event, CommandQueued):
-            self.logger.debug(f"📋 CMD queued: {event.command[:60]}...")
-            event_record["command"] = event.command
-
-        elif isinstance(event, CommandStarted):
-            self.logger.info(f"▶️  CMD started: {event.command[:60]}...")
-            event_record["command"] = event.command
-
-        elif isinstance(event, CommandCompleted):
-            if event.exit_code == 0:
-                self.metrics["commands_executed"] += 1
-                self.logger.info(
-                    f"✅ CMD completed: {event.command[:40]}... "
-                    f"(exit={event.exit_code}, time={event.execution_time:.2f}s)"
-                )
-            else:
-                self.metrics["commands_failed"] += 1
-                self.logger.warning(
-                    f"⚠️  CMD failed: {event.command[:40]}... "
-                    f"(exit={event.exit_code}, error={event.error[:50]})"
-                )
-            event_record["command"] = event.command
-            event_record["exit_code"] = event.exit_code
-            event_record["execution_time"] = event.execution_time
-
-        elif isinstance(event, RunCreated):
-            self.logger.info(f"🆕 RUN {event.run_id} created for {event.repo_url}")
-            event_record["repo_url"] = event.repo_url
+        extra["command"] = event.command
+        extra["exit_code"] = event.exit_code
+        extra["execution_time"] = event.execution_time
+
+    def _on_run_created(self, event, extra):
+        self.logger.info(f"🆕 RUN {event.run_id} created for {event.repo_url}")
+        extra["repo_url"] = event.repo_url
+
+    # Exact-type dispatch: one dict hash lookup per event instead of
+    # walking an isinstance chain.
+    _DISPATCH = {
+        RunStatusChanged: _on_run_status,
+        StepStarted: _on_step_started,
+        StepCompleted: _on_step_completed,
+        StepFailed: _on_step_failed,
+        CommandQueued: _on_command_queued,
+        CommandStarted: _on_command_started,
+        CommandCompleted: _on_command_completed,
+        RunCreated: _on_run_created,
+    }
+
+    def log_event(self, event):
+        """Log and track an event."""
+        event_type = type(event).__name__
+        self.total_events += 1
+        self.by_type[event_type] += 1
 
+        # Store the raw timestamp; ISO formatting is deferred to
+        # get_summary so the hot path skips datetime/strftime work.
+        timestamp = getattr(event, "timestamp", None) or time.time()
+        extra: Dict[str, Any] = {}
+
+        handler = self._DISPATCH.get(type(event))
+        if handler is not None:
+            handler(self, event, extra)
         else:
             self.logger.debug(f"📌 Event: {event_type}")
 
-        self.events.append(event_record)
+        self.events.append(EventRecord(event_type, timestamp, getattr(event, "run_id", None), extra))
+
+    @staticmethod
+    def _format_ts(ts) -> str:
+        """Render a stored timestamp (datetime or epoch float) as ISO-8601."""
+        if isinstance(ts, datetime):
+            return ts.isoformat()
+        return datetime.fromtimestamp(ts).isoformat()
 
     def get_summary(self) -> Dict:
         """Get event metrics summary."""
         return {
             **self.metrics,
-            "event_log": self.events,
+            "event_log": [
+                {"type": r.type, "timestamp": self._format_ts(r.timestamp),
+                 "run_id": r.run_id, **r.extra}
+                for r in self.events
+            ],
         }
 
 
@@ -339,74 +429,113 @@ class ParseDocumentationStep(PipelineStepBase):
 
 
 class ExecuteCommandsStep(PipelineStepBase):
-    """Step that simulates command execution with detailed logging."""
+    """Step that simulates command execution with detailed logging.
+
+    Commands are independent and I/O-bound, so they run concurrently on a
+    bounded thread pool (NOVA_CMD_CONCURRENCY workers, default 8) instead
+    of serially sleeping one after another; dispatch order follows command
+    priority. The pipeline drives steps synchronously from inside the
+    demo's running event loop, so a thread pool is used rather than a
+    nested asyncio loop.
+    """
     name = "execute_commands"
 
     def __init__(self, logger: logging.Logger, simulate_failure: bool = False):
         self.logger = logger
         self.simulate_failure = simulate_failure
 
-    def execute(self, context: PipelineContext) -> StepResult:
+    def _run_one(self, idx: int, cmd: ParsedCommand, context: PipelineContext,
+                 total: int) -> CommandLog:
+        """Simulate one command; idx is the command's original position.
+
+        The three lifecycle events are notification-only here, so they are
+        collected locally and handed to the bus in one batch at the end of
+        the command instead of three synchronous dispatch round-trips.
+        """
         bus = get_event_bus()
-        results = []
+        self.logger.debug(f"Executing command {idx + 1}/{total}: {cmd.text}")
+
+        pending = [CommandQueued(
+            run_id=context.run_id,
+            command=cmd.text,
+            priority=cmd.priority,
+            command_type="install"
+        )]
+
+        # Simulate execution delay
+        time.sleep(0.05)
+
+        pending.append(CommandStarted(
+            run_id=context.run_id,
+            command=cmd.text,
+            container_id="demo-container-001"
+        ))
+
+        # Simulate failure on specific command if configured
+        exit_code = 0
+        error = ""
+        if self.simulate_failure and "mypy" in cmd.text:
+            exit_code = 1
+            error = "Type errors found: 3 issues in 2 files"
+
+        time.sleep(0.02)
+
+        log = CommandLog(
+            id=idx,
+            run_id=context.run_id,
+            command=cmd.text,
+            status=CommandStatus.SUCCESS if exit_code == 0 else CommandStatus.FAILED,
+            timestamp=datetime.now(),
+            exit_code=exit_code,
+            output="Command executed successfully" if exit_code == 0 else "",
+            error=error,
+            execution_time=0.1 + (idx * 0.02),
+            command_type="install",
+            priority=cmd.priority,
+        )
 
-        for idx, cmd in enumerate(context.commands):
-            self.logger.debug(f"Executing command {idx + 1}/{len(context.commands)}: {cmd.text}")
+        pending.append(CommandCompleted(
+            run_id=context.run_id,
+            command=cmd.text,
+            exit_code=exit_code,
+            output=log.output or "",
+            error=log.error or "",
+            execution_time=log.execution_time or 0.0,
+        ))
+
+        # One batched submission per command when the bus supports it;
+        # otherwise dispatch the batch through the regular emit path.
+        emit_many = getattr(bus, "emit_many", None)
+        if emit_many is not None:
+            emit_many(pending)
+        else:
+            for event in pending:
+                bus.emit(event)
 
-            bus.emit(CommandQueued(
-                run_id=context.run_id,
-                command=cmd.text,
-                priority=cmd.priority,
-                command_type="install"
-            ))
+        return log
 
-            # Simulate execution delay
-            time.sleep(0.05)
+    def execute(self, context: PipelineContext) -> StepResult:
+        total = len(context.commands)
 
-            bus.emit(CommandStarted(
-                run_id=context.run_id,
-                command=cmd.text,
-                container_id="demo-container-001"
-            ))
+        # Dispatch highest-priority commands first
+        ordered = sorted(enumerate(context.commands),
+                         key=lambda pair: -pair[1].priority)
+        max_workers = max(1, int(os.environ.get("NOVA_CMD_CONCURRENCY", "8")))
 
-            # Simulate failure on specific command if configured
-            exit_code = 0
-            error = ""
-            if self.simulate_failure and "mypy" in cmd.text:
-                exit_code = 1
-                error = "Type errors found: 3 issues in 2 files"
-
-            time.sleep(0.02)
-
-            log = CommandLog(
-                id=idx,
-                run_id=context.run_id,
-                command=cmd.text,
-                status=CommandStatus.SUCCESS if exit_code == 0 else CommandStatus.FAILED,
-                timestamp=datetime.now(),
-                exit_code=exit_code,
-                output="Command executed successfully" if exit_code == 0 else "",
-                error=error,
-                execution_time=0.1 + (idx * 0.02),
-                command_type="install",
-                priority=cmd.priority,
-            )
-            results.append(log)
-
-            bus.emit(CommandCompleted(
-                run_id=context.run_id,
-                command=cmd.text,
-                exit_code=exit_code,
-                output=log.output or "",
-                error=log.error or "",
-                execution_time=log.execution_time or 0.0,
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(
+                lambda pair: self._run_one(pair[0], pair[1], context, total),
+                ordered,
             ))
 
-            if exit_code != 0:
-                context.results = results
-                return StepResult.fail(f"Command failed: {cmd.text}", recoverable=False)
-
+        # Report in the original command order regardless of completion order
+        results.sort(key=lambda log: log.id)
         context.results = results
+
+        failed = next((log for log in results if log.exit_code != 0), None)
+        if failed is not None:
+            return StepResult.fail(f"Command failed: {failed.command}", recoverable=False)
+
         return StepResult.ok({"executed": len(results), "all_success": True})
 
 
@@ -414,11 +543,13 @@ class MakeDecisionStep(PipelineStepBase):
     """Step that uses decision matrix to make strategic choices."""
     name = "strategic_decision"
 
-    def __init__(self, logger: logging.Logger, memory: MemoryManager):
+    def __init__(self, logger: logging.Logger, memory: "MemoryManager"):
         self.logger = logger
         self.memory = memory
 
     def execute(self, context: PipelineContext) -> StepResult:
+        from novasystem.tools.decision_matrix.decision_matrix import make_decision
+
         self.logger.info("Making strategic decisions based on analysis...")
 
         # Decision: Which testing strategy to use
@@ -464,6 +595,9 @@ class MakeDecisionStep(PipelineStepBase):
 
 async def run_demo(verbose: bool = False, log_dir: Optional[Path] = None):
     """Run the full NovaSystem demonstration."""
+    from novasystem.core.memory import MemoryManager
+    from novasystem.core.vector_store import LocalVectorStore
+
     logger = setup_logging(verbose=verbose, log_dir=log_dir)
 
     print("\n" + "=" * 80)
@@ -15,7 +15,10 @@ Run:
 """
 
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
+from itertools import count
+from operator import countOf
 from pathlib import Path
 from typing import Dict, List
 
@@ -32,65 +35,81 @@ from novasystem.tools.technical_debt import (
 
 def create_sample_debt_items() -> List[TechnicalDebtItem]:
     """Create a realistic set of technical debt items."""
-    items = [
-        TechnicalDebtItem(
-            key="TD-001",
-            title="Legacy authentication module needs refactoring",
-            description="The current authentication module uses deprecated password hashing and needs bcrypt.",
-            severity=Severity.HIGH,
-            component="auth",
+    specs = [
+        (
+            "Legacy authentication module needs refactoring",
+            "The current authentication module uses deprecated password hashing and needs bcrypt.",
+            Severity.HIGH,
+            "auth",
         ),
-        TechnicalDebtItem(
-            key="TD-002",
-            title="Missing unit tests for payment processing",
-            description="Payment processing has only 30% test coverage. Critical paths are untested.",
-            severity=Severity.HIGH,
-            component="payments",
+        (
+            "Missing unit tests for payment processing",
+            "Payment processing has only 30% test coverage. Critical paths are untested.",
+            Severity.HIGH,
+            "payments",
         ),
-        TechnicalDebtItem(
-            key="TD-003",
-            title="Database queries need optimization",
-            description="N+1 query issues in product catalog cause slow page loads.",
-            severity=Severity.MEDIUM,
-            component="database",
+        (
+            "Database queries need optimization",
+            "N+1 query issues in product catalog cause slow page loads.",
+            Severity.MEDIUM,
+            "database",
         ),
-        TechnicalDebtItem(
-            key="TD-004",
-            title="Update deprecated npm packages",
-            description="12 npm packages are outdated, 3 have known vulnerabilities.",
-            severity=Severity.HIGH,
-            component="frontend",
+        (
+            "Update deprecated npm packages",
+            "12 npm packages are outdated, 3 have known vulnerabilities.",
+            Severity.HIGH,
+            "frontend",
         ),
-        TechnicalDebtItem(
-            key="TD-005",
-            title="API documentation is outdated",
-            description="OpenAPI spec doesn't match current endpoints.",
-            severity=Severity.LOW,
-            component="api",
+        (
+            "API documentation is outdated",
+            "OpenAPI spec doesn't match current endpoints.",
+            Severity.LOW,
+            "api",
         ),
-        TechnicalDebtItem(
-            key="TD-006",
-            title="Logging inconsistencies across services",
-            description="Different services use different log formats.",
-            severity=Severity.MEDIUM,
-            component="infrastructure",
+        (
+            "Logging inconsistencies across services",
+            "Different services use different log formats.",
+            Severity.MEDIUM,
+            "infrastructure",
         ),
-        TechnicalDebtItem(
-            key="TD-007",
-            title="Error handling needs standardization",
-            description="Inconsistent error responses across API endpoints.",
-            severity=Severity.MEDIUM,
-            component="api",
+        (
+            "Error handling needs standardization",
+            "Inconsistent error responses across API endpoints.",
+            Severity.MEDIUM,
+            "api",
         ),
-        TechnicalDebtItem(
-            key="TD-008",
-            title="Remove feature flags for launched features",
-            description="15 feature flags for features launched 6+ months ago.",
-            severity=Severity.LOW,
-            component="core",
+        (
+            "Remove feature flags for launched features",
+            "15 feature flags for features launched 6+ months ago.",
+            Severity.LOW,
+            "core",
         ),
     ]
-    return items
+    return [
+        TechnicalDebtItem(
+            key=f"TD-{n:03d}",
+            title=title,
+            description=description,
+            severity=severity,
+            component=component,
+        )
+        for n, (title, description, severity, component) in zip(count(1), specs)
+    ]
+
+
+# Static lookup tables shared by the print helpers; building these dicts
+# per call would redo the work for every rendered item.
+_SEVERITY_COLORS = {
+    Severity.HIGH: "\033[93m",      # Yellow
+    Severity.MEDIUM: "\033[94m",    # Blue
+    Severity.LOW: "\033[92m",       # Green
+}
+_STATUS_ICONS = {
+    Status.OPEN: "📋",
+    Status.IN_PROGRESS: "🔄",
+    Status.RESOLVED: "✅",
+}
+_RESET = "\033[0m"
 
 
 def print_header(title: str):
@@ -100,28 +119,25 @@ def print_header(title: str):
     print("=" * 70)
 
 
-def print_item(item: TechnicalDebtItem, index: int = None):
-    """Print a formatted debt item."""
-    severity_colors = {
-        Severity.HIGH: "\033[93m",      # Yellow
-        Severity.MEDIUM: "\033[94m",    # Blue
-        Severity.LOW: "\033[92m",       # Green
-    }
-    status_icons = {
-        Status.OPEN: "📋",
-        Status.IN_PROGRESS: "🔄",
-        Status.RESOLVED: "✅",
-    }
-
-    color = severity_colors.get(item.severity, "")
-    reset = "\033[0m"
-    icon = status_icons.get(item.status, "❓")
+def format_item(item: TechnicalDebtItem, index: int = None) -> str:
+    """Format a debt item as a multi-line string."""
+    color = _SEVERITY_COLORS.get(item.severity, "")
+    reset = _RESET
+    icon = _STATUS_ICONS.get(item.status, "❓")
 
     prefix = f"{index}. " if index else ""
-    print(f"\n{prefix}{icon} {color}[{item.severity.value.upper()}]{reset} {item.key}: {item.title}")
-    print(f"   Component: {item.component or 'N/A'} | Status: {item.status.value}")
-    if item.status == Status.RESOLVED:
-        print(f"   ✅ Resolved")
+    lines = [
+        f"\n{prefix}{icon} {color}[{item.severity.value.upper()}]{reset} {item.key}: {item.title}",
+        f"   Component: {item.component or 'N/A'} | Status: {item.status.value}",
+    ]
+    if item.status is Status.RESOLVED:
+        lines.append("   ✅ Resolved")
+    return "\n".join(lines)
+
+
+def print_item(item: TechnicalDebtItem, index: int = None):
+    """Print a formatted debt item."""
+    print(format_item(item, index))
 
 
 def print_table(items: List[TechnicalDebtItem]):
@@ -131,13 +147,8 @@ def print_table(items: List[TechnicalDebtItem]):
     print("├" + "─" * 10 + "┼" + "─" * 10 + "┼" + "─" * 15 + "┼" + "─" * 15 + "┤")
 
     for item in items:
-        severity_colors = {
-            Severity.HIGH: "\033[93m",
-            Severity.MEDIUM: "\033[94m",
-            Severity.LOW: "\033[92m",
-        }
-        color = severity_colors.get(item.severity, "")
-        reset = "\033[0m"
+        color = _SEVERITY_COLORS.get(item.severity, "")
+        reset = _RESET
         comp = (item.component or "N/A")[:13]
 
         print(f"│ {item.key:<8} │ {color}{item.severity.value:<8}{reset} │ {comp:<13} │ {item.status.value:<13} │")
@@ -166,35 +177,34 @@ def main():
     # Show prioritized list
     print_header("PRIORITIZED BY SEVERITY")
     prioritized = manager.prioritized()
-    for i, item in enumerate(prioritized, 1):
-        print_item(item, i)
+    # Format every item first, then emit one write instead of several
+    # print calls per item.
+    sys.stdout.write(
+        "\n".join(format_item(item, i) for i, item in enumerate(prioritized, 1)) + "\n"
+    )
 
     # Filter by component
     print_header("DEBT BY COMPONENT: API")
     api_items = [i for i in manager if i.component == "api"]
-    for item in api_items:
-        print_item(item)
+    sys.stdout.write("\n".join(format_item(item) for item in api_items) + "\n")
 
     # Show severity breakdown
     print_header("SEVERITY BREAKDOWN")
-    breakdown = {}
-    for item in manager:
-        sev = item.severity
-        breakdown[sev] = breakdown.get(sev, 0) + 1
+    breakdown = Counter(item.severity for item in manager)
 
     total = sum(breakdown.values()) or 1
 
-    for severity, count in sorted(breakdown.items(), key=lambda x: x[1], reverse=True):
-        bar_length = int((count / total) * 30)
+    for severity, sev_count in breakdown.most_common():
+        bar_length = int((sev_count / total) * 30)
         bar = "█" * bar_length
-        percentage = (count / total) * 100
-        print(f"  {severity.value:>10}: {bar:<30} {count} ({percentage:.0f}%)")
+        percentage = (sev_count / total) * 100
+        print(f"  {severity.value:>10}: {bar:<30} {sev_count} ({percentage:.0f}%)")
 
     # Simulate working on items
     print_header("SIMULATING SPRINT WORK")
 
     # Start working on high severity item
-    high_items = [i for i in prioritized if i.severity == Severity.HIGH]
+    high_items = [i for i in prioritized if i.severity is Severity.HIGH]
     if high_items:
         item = high_items[0]
         print(f"\n🔄 Starting work on {item.key}: {item.title}")
@@ -202,7 +212,7 @@ def main():
         print(f"   Status changed to: {item.status.value}")
 
     # Resolve a low priority item
-    low_items = [i for i in prioritized if i.severity == Severity.LOW]
+    low_items = [i for i in prioritized if i.severity is Severity.LOW]
     if low_items:
         item = low_items[0]
         print(f"\n✅ Resolving {item.key}: {item.title}")
@@ -211,7 +221,7 @@ def main():
 
     # Show item details
     print_header("ITEM DETAILS")
-    update_item = next((i for i in manager if i.key == "TD-003"), None)
+    update_item = manager.get_item("TD-003")
     if update_item:
         print(f"Key: {update_item.key}")
         print(f"Title: {update_item.title}")
@@ -222,12 +232,16 @@ def main():
     # Show final status
     print_header("FINAL STATUS SUMMARY")
 
-    open_count = len([i for i in manager if i.status == Status.OPEN])
-    in_progress_count = len([i for i in manager if i.status == Status.IN_PROGRESS])
-    resolved_count = len([i for i in manager if i.status == Status.RESOLVED])
-    high_count = len([i for i in manager if i.severity == Severity.HIGH])
-    medium_count = len([i for i in manager if i.severity == Severity.MEDIUM])
-    low_count = len([i for i in manager if i.severity == Severity.LOW])
+    # Materialize each attribute once, then count in C via operator.countOf
+    # instead of six separate filtered scans.
+    statuses = [i.status for i in manager]
+    severities = [i.severity for i in manager]
+    open_count = countOf(statuses, Status.OPEN)
+    in_progress_count = countOf(statuses, Status.IN_PROGRESS)
+    resolved_count = countOf(statuses, Status.RESOLVED)
+    high_count = countOf(severities, Severity.HIGH)
+    medium_count = countOf(severities, Severity.MEDIUM)
+    low_count = countOf(severities, Severity.LOW)
 
     print(f"""
 📊 Technical Debt Summary: